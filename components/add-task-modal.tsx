@@ -16,6 +16,13 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@
 import { CalendarIcon, Sparkles } from "lucide-react"
 import { format } from "date-fns"
 
+// Keyword tiers for the importance suggestion, checked in order
+const IMPORTANCE_KEYWORDS: [RegExp, number][] = [
+  [/urgent|asap/i, 9],
+  [/important|critical/i, 8],
+  [/meeting|deadline/i, 7],
+]
+
 type AddTaskModalProps = {
   open: boolean
   onOpenChange: (open: boolean) => void
@@ -55,12 +62,8 @@ export function AddTaskModal({ open, onOpenChange, onAdd }: AddTaskModalProps) {
     setAiSuggesting(true)
     // Simulate AI suggestion
     setTimeout(() => {
-      const keywords = description.toLowerCase()
-      let suggested = 5
-      if (keywords.includes("urgent") || keywords.includes("asap")) suggested = 9
-      else if (keywords.includes("important") || keywords.includes("critical")) suggested = 8
-      else if (keywords.includes("meeting") || keywords.includes("deadline")) suggested = 7
-      setImportance(suggested)
+      const match = IMPORTANCE_KEYWORDS.find(([pattern]) => pattern.test(description))
+      setImportance(match ? match[1] : 5)
       setAiSuggesting(false)
     }, 800)
   }
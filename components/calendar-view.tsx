@@ -8,7 +8,7 @@ import { Card } from "@/components/ui/card"
 import { ScrollArea } from "@/components/ui/scroll-area"
 import { Badge } from "@/components/ui/badge"
 import { Clock, CalendarIcon } from "lucide-react"
-import { format, addDays, startOfWeek, addHours } from "date-fns"
+import { format, addDays, startOfWeek } from "date-fns"
 import { cn } from "@/lib/utils"
 
 type CalendarViewProps = {
@@ -17,6 +17,9 @@ type CalendarViewProps = {
   onUpdateTask: (id: string, updates: Partial<Task>) => void
 }
 
+const HOURS = Array.from({ length: 14 }, (_, i) => i + 7) // 7 AM to 8 PM
+const HOUR_LABELS = HOURS.map((hour) => format(new Date().setHours(hour, 0, 0, 0), "h a"))
+
 export function CalendarView({ tasks, viewMode, onUpdateTask }: CalendarViewProps) {
   const [dragOverSlot, setDragOverSlot] = useState<string | null>(null)
 
@@ -56,10 +59,19 @@ export function CalendarView({ tasks, viewMode, onUpdateTask }: CalendarViewProp
     }
   }
 
-  const hours = Array.from({ length: 14 }, (_, i) => i + 7) // 7 AM to 8 PM
-
   if (viewMode === "week") {
     const weekDays = Array.from({ length: 7 }, (_, i) => addDays(weekStart, i))
+    const todayKey = format(today, "yyyy-MM-dd")
+
+    // Bucket scheduled tasks by slot once instead of filtering every task per slot
+    const tasksBySlot = new Map<string, Task[]>()
+    for (const task of tasks) {
+      if (!task.scheduledTime) continue
+      const key = `${format(task.scheduledTime, "yyyy-MM-dd")}-${task.scheduledTime.getHours()}`
+      const slotTasks = tasksBySlot.get(key)
+      if (slotTasks) slotTasks.push(task)
+      else tasksBySlot.set(key, [task])
+    }
 
     return (
       <ScrollArea className="flex-1">
@@ -68,73 +80,66 @@ export function CalendarView({ tasks, viewMode, onUpdateTask }: CalendarViewProp
             {/* Time column */}
             <div className="space-y-16">
               <div className="h-12" /> {/* Header spacer */}
-              {hours.map((hour) => (
+              {HOURS.map((hour, i) => (
                 <div key={hour} className="text-xs text-muted-foreground h-20 flex items-start">
-                  {format(addHours(new Date().setHours(hour, 0, 0, 0), 0), "h a")}
+                  {HOUR_LABELS[i]}
                 </div>
               ))}
             </div>
 
             {/* Days columns */}
-            {weekDays.map((day) => (
-              <div key={day.toISOString()} className="space-y-2">
-                <div className="h-12 flex flex-col items-center justify-center border-b border-border">
-                  <span className="text-xs text-muted-foreground font-medium">{format(day, "EEE")}</span>
-                  <span
-                    className={cn(
-                      "text-lg font-semibold",
-                      format(day, "yyyy-MM-dd") === format(today, "yyyy-MM-dd") && "text-primary",
-                    )}
-                  >
-                    {format(day, "d")}
-                  </span>
-                </div>
+            {weekDays.map((day) => {
+              const dayKey = format(day, "yyyy-MM-dd")
+
+              return (
+                <div key={day.toISOString()} className="space-y-2">
+                  <div className="h-12 flex flex-col items-center justify-center border-b border-border">
+                    <span className="text-xs text-muted-foreground font-medium">{format(day, "EEE")}</span>
+                    <span className={cn("text-lg font-semibold", dayKey === todayKey && "text-primary")}>
+                      {format(day, "d")}
+                    </span>
+                  </div>
+
+                  <div className="space-y-16">
+                    {HOURS.map((hour) => {
+                      const slotId = `${dayKey}-${hour}`
+                      const hourTasks = tasksBySlot.get(slotId) ?? []
 
-                <div className="space-y-16">
-                  {hours.map((hour) => {
-                    const slotId = `${format(day, "yyyy-MM-dd")}-${hour}`
-                    const hourTasks = tasks.filter((task) => {
-                      if (!task.scheduledTime) return false
                       return (
-                        format(task.scheduledTime, "yyyy-MM-dd") === format(day, "yyyy-MM-dd") &&
-                        task.scheduledTime.getHours() === hour
+                        <div
+                          key={hour}
+                          onDragOver={(e) => handleDragOver(e, slotId)}
+                          onDragLeave={handleDragLeave}
+                          onDrop={(e) => handleDrop(e, day, hour)}
+                          className={cn(
+                            "min-h-[80px] border-t border-border/50 pt-1 transition-colors rounded-md",
+                            dragOverSlot === slotId && "bg-primary/10 border-primary",
+                          )}
+                        >
+                          {hourTasks.map((task) => (
+                            <Card
+                              key={task.id}
+                              className={cn(
+                                "p-2 mb-1 border-l-4 cursor-pointer hover:shadow-md transition-all",
+                                getImportanceColor(task.importance),
+                                task.completed && "opacity-50",
+                              )}
+                              onClick={() => onUpdateTask(task.id, { completed: !task.completed })}
+                            >
+                              <h4 className="font-medium text-xs line-clamp-1">{task.title}</h4>
+                              <div className="flex items-center gap-1 mt-1">
+                                <Clock className="h-3 w-3 text-muted-foreground" />
+                                <span className="text-xs text-muted-foreground">{task.estimatedTime}m</span>
+                              </div>
+                            </Card>
+                          ))}
+                        </div>
                       )
-                    })
-
-                    return (
-                      <div
-                        key={hour}
-                        onDragOver={(e) => handleDragOver(e, slotId)}
-                        onDragLeave={handleDragLeave}
-                        onDrop={(e) => handleDrop(e, day, hour)}
-                        className={cn(
-                          "min-h-[80px] border-t border-border/50 pt-1 transition-colors rounded-md",
-                          dragOverSlot === slotId && "bg-primary/10 border-primary",
-                        )}
-                      >
-                        {hourTasks.map((task) => (
-                          <Card
-                            key={task.id}
-                            className={cn(
-                              "p-2 mb-1 border-l-4 cursor-pointer hover:shadow-md transition-all",
-                              getImportanceColor(task.importance),
-                              task.completed && "opacity-50",
-                            )}
-                            onClick={() => onUpdateTask(task.id, { completed: !task.completed })}
-                          >
-                            <h4 className="font-medium text-xs line-clamp-1">{task.title}</h4>
-                            <div className="flex items-center gap-1 mt-1">
-                              <Clock className="h-3 w-3 text-muted-foreground" />
-                              <span className="text-xs text-muted-foreground">{task.estimatedTime}m</span>
-                            </div>
-                          </Card>
-                        ))}
-                      </div>
-                    )
-                  })}
+                    })}
+                  </div>
                 </div>
-              </div>
-            ))}
+              )
+            })}
           </div>
         </div>
       </ScrollArea>